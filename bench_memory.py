@@ -0,0 +1,129 @@
+"""Rough memory benchmark for the default vs memory-compact cleaning pipeline.
+
+Usage:
+    python bench_memory.py [rows] [columns]
+
+Defaults to 300000 x 10; use 1000000 40 for the full-size check. Each mode runs
+in its own subprocess so peak RSS is measured separately. Insert is simulated
+with a cursor that discards rows, so no database is needed.
+tracemalloc does not see memory allocated by pyarrow, so compare peak RSS for
+the compact mode.
+"""
+import logging
+import subprocess
+import sys
+import tracemalloc
+
+import numpy as np
+import pandas as pd
+
+import main
+
+
+class NullCursor:
+    fast_executemany = False
+
+    def __init__(self):
+        self.rows = []
+
+    def executemany(self, sql, rows):
+        # Keep only the first batch for the sanitize check
+        if not self.rows:
+            self.rows = rows
+
+    def execute(self, sql, row):
+        pass
+
+
+class NullConnection:
+    def commit(self):
+        pass
+
+    def rollback(self):
+        pass
+
+
+def make_frame(n_rows, n_cols):
+    rng = np.random.default_rng(0)
+    data = {}
+    for i in range(n_cols):
+        kind = i % 5
+        if kind == 0:
+            data[f"int_{i}"] = rng.integers(0, 1_000_000, n_rows)
+        elif kind == 1:
+            data[f"float_{i}"] = rng.random(n_rows)
+        elif kind == 2:
+            data[f"date_{i}"] = pd.Timestamp("2020-01-01") + pd.to_timedelta(rng.integers(0, 2000, n_rows), unit="D")
+        elif kind == 3:
+            data[f"status_{i}"] = rng.choice([" open", "closed ", "pending", None], n_rows)
+        else:
+            data[f"text_{i}"] = [f" item {v} " for v in rng.integers(0, 10_000_000, n_rows)]
+    return pd.DataFrame(data)
+
+
+def peak_rss_mb():
+    try:
+        import resource
+    except ImportError:
+        return None
+    # ru_maxrss is in kilobytes on Linux
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def run_mode(mode, n_rows, n_cols):
+    df = make_frame(n_rows, n_cols)
+    compact = mode == "compact"
+
+    tracemalloc.start()
+    df = main.clean_dataframe(df, compact=compact)
+    clean_peak = tracemalloc.get_traced_memory()[1]
+
+    importer = main.SQLImporter("")
+    importer.cursor = NullCursor()
+    importer.conn = NullConnection()
+    importer.insert_data("bench", df)
+    total_peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    frame_mb = main.log_memory_usage(df).sum() / 1024 ** 2
+    rss = peak_rss_mb()
+    print(f"{mode:8} frame {frame_mb:8.1f} MB | clean peak {clean_peak / 1024 ** 2:8.1f} MB | "
+          f"clean+insert peak {total_peak / 1024 ** 2:8.1f} MB | "
+          f"peak RSS {'n/a' if rss is None else f'{rss:.1f} MB'}")
+
+
+def check_sanitize():
+    df = pd.DataFrame({
+        "text": pd.array(["a", None], dtype=main.STRING_DTYPE),
+        "cat": pd.Categorical(["x", None]),
+        "when": pd.to_datetime(["2024-01-02", None]),
+        "num": pd.array([1, None], dtype="Int64"),
+        "flt": [1.5, np.nan],
+    })
+    report = main.log_memory_usage(df)
+    assert list(report.index) == list(df.columns)
+    assert (report > 0).all()
+
+    importer = main.SQLImporter("")
+    importer.cursor = NullCursor()
+    importer.conn = NullConnection()
+    importer.insert_data("check", df)
+    first, second = importer.cursor.rows
+    assert type(first[2]) is not pd.Timestamp and first[2].year == 2024
+    assert first == ["a", "x", first[2], 1, 1.5]
+    assert type(first[3]) is int
+    assert second == [None] * 5, second
+    print("sanitize check: ok")
+
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1 and sys.argv[1] in ("default", "compact"):
+        logging.disable(logging.INFO)
+        run_mode(sys.argv[1], int(sys.argv[2]), int(sys.argv[3]))
+    else:
+        rows = int(sys.argv[1]) if len(sys.argv) > 1 else 300_000
+        cols = int(sys.argv[2]) if len(sys.argv) > 2 else 10
+        check_sanitize()
+        print(f"{rows} rows x {cols} columns")
+        for mode in ("default", "compact"):
+            subprocess.run([sys.executable, __file__, mode, str(rows), str(cols)], check=True)
@@ -0,0 +1,105 @@
+"""Checks for reading compressed files and zip archives with read_file.
+
+Usage:
+    python check_archive.py
+
+Each case builds its zip in memory, writes it to a temporary directory and
+asserts on what read_file returns. No database is needed.
+"""
+import gzip
+import io
+import os
+import tempfile
+import zipfile
+
+import pandas as pd
+
+import main
+
+
+def build_zip(members):
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w") as zf:
+        for name, data in members.items():
+            zf.writestr(name, data)
+    return buffer.getvalue()
+
+
+def read_zip(tmp_dir, members, preview_rows=None):
+    path = os.path.join(tmp_dir, "archive.zip")
+    with open(path, "wb") as f:
+        f.write(build_zip(members))
+    return main.read_file(path, preview_rows=preview_rows)
+
+
+def expect_error(tmp_dir, members, text):
+    try:
+        read_zip(tmp_dir, members)
+    except ValueError as e:
+        assert text in str(e), e
+    else:
+        raise AssertionError(f"expected ValueError mentioning {text!r}")
+
+
+def excel_bytes(df):
+    buffer = io.BytesIO()
+    df.to_excel(buffer, index=False, engine="openpyxl")
+    return buffer.getvalue()
+
+
+def check_archives(tmp_dir):
+    expected = pd.DataFrame({"a": [1, 3, 5], "b": [2, 4, 6]})
+
+    # Chained CSVs, first one without a trailing newline
+    df = read_zip(tmp_dir, {"one.csv": "a,b\n1,2\n3,4", "sub/two.csv": "a,b\n5,6\n"})
+    pd.testing.assert_frame_equal(df, expected)
+
+    # Preview rows span member boundaries
+    df = read_zip(tmp_dir, {"one.csv": "a,b\n1,2\n", "two.csv": "a,b\n3,4\n5,6\n"}, preview_rows=2)
+    pd.testing.assert_frame_equal(df, expected.head(2))
+
+    # macOS Finder metadata is ignored
+    df = read_zip(tmp_dir, {
+        "one.csv": "a,b\n1,2\n3,4\n5,6\n",
+        "__MACOSX/._one.csv": b"\x00\x05\x16\x07\xff\xfe",
+        "._two.csv": b"\xff\xfe",
+    })
+    pd.testing.assert_frame_equal(df, expected)
+
+    # Later member with CR-only line endings (Excel for Mac CSV export)
+    df = read_zip(tmp_dir, {"one.csv": "a,b\n1,2\n3,4\n", "two.csv": "a,b\r5,6\r"})
+    pd.testing.assert_frame_equal(df, expected)
+
+    # Later member starting with a blank line
+    df = read_zip(tmp_dir, {"one.csv": "a,b\n1,2\n3,4\n", "two.csv": "\na,b\n5,6\n"})
+    pd.testing.assert_frame_equal(df, expected)
+
+    # Header with a quoted newline
+    df = read_zip(tmp_dir, {"one.csv": '"a\nx",b\n1,2\n3,4\n', "two.csv": '"a\nx",b\n5,6\n'})
+    pd.testing.assert_frame_equal(df, expected.rename(columns={"a": "a\nx"}))
+
+    # Members must share the first member's columns
+    expect_error(tmp_dir, {"one.csv": "x,y\n1,2\n", "two.csv": "x,z\n1,2\n"}, "'two.csv'")
+
+    # Empty members are reported by name
+    expect_error(tmp_dir, {"one.csv": "a,b\n1,2\n", "empty.csv": ""}, "'empty.csv'")
+
+    # Mixed Excel and CSV members fall back to per-member reads
+    df = read_zip(tmp_dir, {"one.xlsx": excel_bytes(expected.head(2)), "two.csv": "a,b\n5,6\n"})
+    pd.testing.assert_frame_equal(df, expected)
+
+    expect_error(tmp_dir, {"notes.txt": "hello"}, "no .csv")
+
+
+def check_compressed(tmp_dir):
+    path = os.path.join(tmp_dir, "data.csv.gz")
+    with gzip.open(path, "wt") as f:
+        f.write("a,b\n1,2\n3,4\n")
+    pd.testing.assert_frame_equal(main.read_file(path), pd.DataFrame({"a": [1, 3], "b": [2, 4]}))
+
+
+if __name__ == "__main__":
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        check_archives(tmp_dir)
+        check_compressed(tmp_dir)
+    print("archive checks: ok")
@@ -7,6 +7,9 @@ import re
 import logging
 import traceback
 import json
+import io
+import csv
+import zipfile
 from PIL import Image, ImageTk
 import xlrd
 
@@ -15,6 +18,19 @@ with open("config.json", "r") as f:
     config = json.load(f)
 SQL_CONN_STR = config["SQL_CONN_STR"]
 
+# Arrow-backed strings store text in one contiguous buffer instead of one
+# boxed Python object per cell; fall back to pandas' own string dtype.
+try:
+    import pyarrow  # noqa: F401
+    STRING_DTYPE = "string[pyarrow]"
+except ImportError:
+    STRING_DTYPE = "string"
+
+INSERT_BATCH_SIZE = 10000
+# Text columns whose distinct/total ratio is at or below this are stored as
+# categoricals (dictionary-encoded) in memory-compact mode.
+CATEGORY_MAX_RATIO = 0.5
+
 
 class SQLImporter:
     def __init__(self, conn_str):
@@ -85,7 +101,7 @@ class SQLImporter:
         self.cursor.execute(f"DROP TABLE {self.full_table_name(table_name)}")
         self.conn.commit()
 
-    def insert_data(self, table_name, df):
+    def insert_data(self, table_name, df, batch_size=INSERT_BATCH_SIZE):
         columns = ", ".join(f"[{col}]" for col in df.columns)
         placeholders = ", ".join("?" for _ in df.columns)
         insert_sql = f"INSERT INTO {self.full_table_name(table_name)} ({columns}) VALUES ({placeholders})"
@@ -97,8 +113,8 @@ class SQLImporter:
             # pandas Timestamp -> Python datetime
             if isinstance(val, pd.Timestamp):
                 return val.to_pydatetime()
-            # NaT -> None
-            if val is pd.NaT:
+            # NaT / NA (nullable and string dtypes) -> None
+            if val is pd.NaT or val is pd.NA:
                 return None
             # float NaN -> None  (covers str-dtype NaN from values.tolist())
             if isinstance(val, float) and val != val:
@@ -116,26 +132,35 @@ class SQLImporter:
                 pass
             return val
 
-        rows = [
-            [sanitize(v) for v in row]
-            for row in df.itertuples(index=False, name=None)
-        ]
+        # Convert to Python values one batch at a time so only batch_size rows
+        # are ever held as a list of lists alongside the DataFrame.
+        self.cursor.fast_executemany = True
+        # Every batch is attempted even after a failure so all good rows get
+        # in; the first error is raised once the whole frame has been tried.
+        first_error = None
+        for start in range(0, len(df), batch_size):
+            rows = [
+                [sanitize(v) for v in row]
+                for row in df.iloc[start:start + batch_size].itertuples(index=False, name=None)
+            ]
 
-        try:
-            self.cursor.fast_executemany = True
-            self.cursor.executemany(insert_sql, rows)
-            self.conn.commit()
-        except Exception as e:
-            logging.error(f"Batch insert failed: {e}. Trying row-by-row...")
-            self.conn.rollback()
-            for i, row in enumerate(rows):
-                try:
-                    self.cursor.execute(insert_sql, row)
-                    self.conn.commit()
-                except Exception as row_error:
-                    self.conn.rollback()
-                    logging.error(f"Row {i} failed: {dict(zip(df.columns, row))} | Error: {row_error}")
-            raise e
+            try:
+                self.cursor.executemany(insert_sql, rows)
+                self.conn.commit()
+            except Exception as e:
+                logging.error(f"Batch insert failed at row {start}: {e}. Trying row-by-row...")
+                self.conn.rollback()
+                first_error = first_error or e
+                for i, row in enumerate(rows, start):
+                    try:
+                        self.cursor.execute(insert_sql, row)
+                        self.conn.commit()
+                    except Exception as row_error:
+                        self.conn.rollback()
+                        logging.error(f"Row {i} failed: {dict(zip(df.columns, row))} | Error: {row_error}")
+
+        if first_error:
+            raise first_error
 
 
 def sanitize_column_name(col):
@@ -146,7 +171,10 @@ def map_dtype_to_sql(col_name, col_data=None):
     return "NVARCHAR(MAX)"
 
 
-def clean_dataframe(df):
+def clean_dataframe(df, compact=False):
+    if compact:
+        return clean_dataframe_compact(df)
+
     # Step 1: Force all columns to object dtype FIRST so that where() replaces
     # NaN/NaT with Python None correctly across all pandas versions (including 3+
     # where str-dtype columns don't respond to the old where() approach).
@@ -173,27 +201,235 @@ def clean_dataframe(df):
     return df
 
 
-def read_file(file_path, preview_rows=None):
-    ext = os.path.splitext(file_path)[1].lower()
-    read_args = {}
-    if preview_rows:
-        read_args['nrows'] = preview_rows
+def clean_dataframe_compact(df):
+    # Memory-compact variant of clean_dataframe: numeric and datetime columns
+    # keep their native dtypes (missing values stay NaN/NaT and are turned
+    # into None by insert_data), text goes to Arrow-backed strings. A shallow
+    # copy keeps the caller's frame untouched without duplicating its data.
+    if STRING_DTYPE != "string[pyarrow]":
+        logging.warning("pyarrow is not installed; compact mode falls back to Python-object strings")
+    df = df.copy(deep=False)
+    text_cols = [col for col in df.columns if df[col].dtype == object or pd.api.types.is_string_dtype(df[col])]
+
+    for col in text_cols:
+        is_phone = "tel" in col.lower() or "phone" in col.lower()
+
+        # Mixed columns (e.g. numbers and text) stay object so non-string values
+        # are kept intact; only their string values are cleaned.
+        # str/string dtypes can only hold strings, so only object columns need the scan.
+        if df[col].dtype == object and not df[col].dropna().map(lambda x: isinstance(x, str)).all():
+            df[col] = df[col].map(lambda x: clean_text_value(x, is_phone) if isinstance(x, str) else x)
+            continue
+
+        series = df[col].astype(STRING_DTYPE)
+
+        # Phone column cleanup, then strip, in the same order as default mode
+        if is_phone:
+            series = series.str.replace(r'(?i)^ph:\s*', '', regex=True)
+        series = series.str.strip()
+
+        # Dictionary-encode low-cardinality text
+        if len(series) and series.nunique() / len(series) <= CATEGORY_MAX_RATIO:
+            series = series.astype("category")
+        df[col] = series
+
+    log_memory_usage(df)
+    return df
+
+
+def clean_text_value(value, is_phone=False):
+    if is_phone:
+        value = re.sub(r'(?i)^ph:\s*', '', value)
+    return value.strip()
+
+
+def log_memory_usage(df):
+    usage = df.memory_usage(index=False, deep=True)
+    for col, nbytes in usage.items():
+        logging.info(f"Memory: {col} ({df[col].dtype}) {nbytes / 1024 ** 2:.2f} MB")
+    logging.info(f"Memory: total {usage.sum() / 1024 ** 2:.2f} MB for {len(df)} rows")
+    return usage
+
+
+# Compressed CSV suffixes -> pandas `compression=` value. pandas decompresses
+# these as a stream while parsing, so nothing is written to disk.
+COMPRESSED_CSV_EXTS = {
+    ".csv.gz": "gzip",
+    ".csv.bz2": "bz2",
+    ".csv.zst": "zstd",
+}
+ARCHIVE_MEMBER_EXTS = (".csv", ".xlsx", ".xls")
+
+
+def get_file_ext(file_path):
+    name = os.path.basename(file_path).lower()
+    for ext in COMPRESSED_CSV_EXTS:
+        if name.endswith(ext):
+            return ext
+    return os.path.splitext(name)[1]
+
+
+def list_archive_members(file_path):
+    # Skip macOS Finder metadata (__MACOSX/ folder and ._ resource forks).
+    with zipfile.ZipFile(file_path) as zf:
+        return [
+            info.filename for info in zf.infolist()
+            if not info.is_dir()
+            and not info.filename.startswith("__MACOSX/")
+            and not os.path.basename(info.filename).startswith("._")
+            and info.filename.lower().endswith(ARCHIVE_MEMBER_EXTS)
+        ]
+
+
+class ArchiveCSVStream(io.TextIOBase):
+    """Reads several CSV members of a zip as one text stream.
+
+    The header record of every member after the first is skipped with a CSV
+    reader (so quoted newlines, CR-only line endings and leading blank lines
+    are handled), letting pandas parse all members in a single pass without
+    holding one frame per member.
+    """
+
+    def __init__(self, zf, members):
+        self.zf = zf
+        self.members = iter(members)
+        self.current = None
+        self.first = True
+        self.last_char = "\n"
+
+    def readable(self):
+        return True
+
+    def _open_next_member(self):
+        member = next(self.members, None)
+        if member is None:
+            return False
+        self.current = io.TextIOWrapper(self.zf.open(member), encoding="utf-8-sig", newline="")
+        if not self.first:
+            # pandas skips blank lines before the header, so do the same here
+            for row in csv.reader(self.current):
+                if row:
+                    break
+        self.first = False
+        return True
+
+    def read(self, size=-1):
+        size = -1 if size is None else size
+        parts = []
+        length = 0
+        while size < 0 or length < size:
+            if self.current is None and not self._open_next_member():
+                break
+            data = self.current.read(size - length if size >= 0 else -1)
+            if data:
+                parts.append(data)
+                length += len(data)
+                self.last_char = data[-1]
+            else:
+                self.current.close()
+                self.current = None
+                # Keep the next member's first row off the previous last row
+                if self.last_char not in "\r\n":
+                    parts.append("\n")
+                    length += 1
+                    self.last_char = "\n"
+        return "".join(parts)
+
+    def close(self):
+        if self.current:
+            self.current.close()
+        super().close()
+
+
+def read_stream(stream, ext, read_args):
     if ext == ".csv":
-        return pd.read_csv(file_path, **read_args)
+        return pd.read_csv(stream, **read_args)
     elif ext == ".xlsx":
-        return pd.read_excel(file_path, engine='openpyxl', **read_args)
+        return pd.read_excel(stream, engine='openpyxl', **read_args)
     elif ext == ".xls":
-        return pd.read_excel(file_path, engine='xlrd', **read_args)
+        return pd.read_excel(stream, engine='xlrd', **read_args)
     else:
         raise ValueError("Unsupported file format. Use .csv, .xlsx, or .xls")
 
 
+def read_archive(file_path, preview_rows=None):
+    # Each member is decompressed as a stream straight into the parser,
+    # never extracted to disk. Multiple members are imported as one dataset.
+    members = list_archive_members(file_path)
+    if not members:
+        raise ValueError("Archive contains no .csv, .xlsx, or .xls files")
+    logging.info(f"Reading {len(members)} archive member(s) from {file_path}: {members}")
+
+    read_args = {'nrows': preview_rows} if preview_rows else {}
+    with zipfile.ZipFile(file_path) as zf:
+        # Every member must share the first member's columns, otherwise the
+        # import would silently pad with NaN and the preview would not match.
+        expected = None
+        for member in members:
+            try:
+                with zf.open(member) as stream:
+                    columns = read_stream(stream, os.path.splitext(member)[1].lower(), {'nrows': 0}).columns.tolist()
+            except pd.errors.EmptyDataError:
+                raise ValueError(f"Archive member '{member}' is empty")
+            if expected is None:
+                expected = columns
+            elif columns != expected:
+                raise ValueError(f"Archive member '{member}' has columns {columns}, expected {expected}")
+
+        if all(member.lower().endswith(".csv") for member in members):
+            with ArchiveCSVStream(zf, members) as stream:
+                return pd.read_csv(stream, **read_args)
+
+        # Excel members cannot be chained as one stream; read them one by one.
+        frames = []
+        remaining = preview_rows
+        for member in members:
+            read_args = {'nrows': remaining} if remaining else {}
+            with zf.open(member) as stream:
+                frames.append(read_stream(stream, os.path.splitext(member)[1].lower(), read_args))
+            if remaining:
+                remaining -= len(frames[-1])
+                if remaining <= 0:
+                    break
+    return pd.concat(frames, ignore_index=True)
+
+
+def read_file(file_path, preview_rows=None):
+    ext = get_file_ext(file_path)
+    read_args = {}
+    if preview_rows:
+        read_args['nrows'] = preview_rows
+    if ext in COMPRESSED_CSV_EXTS:
+        return pd.read_csv(file_path, compression=COMPRESSED_CSV_EXTS[ext], **read_args)
+    elif ext == ".zip":
+        return read_archive(file_path, preview_rows)
+    elif ext in ARCHIVE_MEMBER_EXTS:
+        return read_stream(file_path, ext, read_args)
+    else:
+        raise ValueError("Unsupported file format. Use .csv, .xlsx, .xls, .csv.gz, .csv.bz2, .csv.zst, or .zip")
+
+
 def browse_file():
-    file_path = filedialog.askopenfilename(filetypes=[("CSV & Excel files", "*.csv *.xlsx *.xls")])
+    file_path = filedialog.askopenfilename(filetypes=[
+        ("All supported files", "*.csv *.xlsx *.xls *.csv.gz *.csv.bz2 *.csv.zst *.zip"),
+        ("CSV & Excel files", "*.csv *.xlsx *.xls"),
+        ("Compressed CSV & archives", "*.csv.gz *.csv.bz2 *.csv.zst *.zip"),
+    ])
     file_entry.delete(0, tk.END)
     file_entry.insert(0, file_path)
     if file_path:
-        status_label.config(text=f"✅ Selected file: {os.path.basename(file_path)}", foreground="green")
+        text = f"✅ Selected file: {os.path.basename(file_path)}"
+        if get_file_ext(file_path) == ".zip":
+            try:
+                members = list_archive_members(file_path)
+                shown = ", ".join(members[:3])
+                if len(members) > 3:
+                    shown += f", ... (+{len(members) - 3} more)"
+                text += f" ({len(members)} file(s): {shown})"
+            except zipfile.BadZipFile as e:
+                status_label.config(text=f"❌ Invalid archive: {e}", foreground="red")
+                return
+        status_label.config(text=text, foreground="green")
 
 
 def map_columns(file_columns, existing_columns):
@@ -267,6 +503,7 @@ def import_data():
     file_path = file_entry.get().strip()
     table_name = table_entry.get().strip()
     preview_count = int(preview_dropdown.get())
+    compact = compact_var.get()
 
     if not file_path or not table_name:
         messagebox.showwarning("Missing info", "Please select a file and enter a table name.")
@@ -298,7 +535,7 @@ def import_data():
         app.update()
         full_df = read_file(file_path)
         full_df.columns = [sanitize_column_name(col) for col in full_df.columns]
-        full_df = clean_dataframe(full_df)
+        full_df = clean_dataframe(full_df, compact=compact)
 
         # Step 5: Column mapping (existing table only)
         if existing_columns:
@@ -381,82 +618,86 @@ def update_preview(df):
 
 
 # === GUI ===
-app = tk.Tk()
-app.title("Fibre2Fashion Excel/CSV to SQL Importer")
-app.configure(bg="#f5f5f5")
-
-window_width = 1200
-window_height = 800
-screen_width = app.winfo_screenwidth()
-screen_height = app.winfo_screenheight()
-position_top = int(screen_height / 2 - window_height / 2)
-position_right = int(screen_width / 2 - window_width / 2)
-app.geometry(f'{window_width}x{window_height}+{position_right}+{position_top}')
-
-style = ttk.Style()
-style.theme_use("clam")
-style.configure(".", background="#f5f5f5", font=("Arial", 10))
-style.configure("Header.TLabel", font=("Arial", 12, "bold"))
-style.configure("Accent.TButton", font=("Arial", 11, "bold"), foreground="white", background="#4CAF50")
-style.map("Accent.TButton", background=[('active', '#45a049')])
-style.configure("Treeview", font=("Arial", 9), rowheight=25)
-
-main_frame = ttk.Frame(app, padding="20")
-main_frame.pack(fill='both', expand=True)
-
-header_frame = ttk.Frame(main_frame)
-header_frame.pack(fill='x', pady=(0, 20))
+if __name__ == "__main__":
+    app = tk.Tk()
+    app.title("Fibre2Fashion Excel/CSV to SQL Importer")
+    app.configure(bg="#f5f5f5")
+
+    window_width = 1200
+    window_height = 800
+    screen_width = app.winfo_screenwidth()
+    screen_height = app.winfo_screenheight()
+    position_top = int(screen_height / 2 - window_height / 2)
+    position_right = int(screen_width / 2 - window_width / 2)
+    app.geometry(f'{window_width}x{window_height}+{position_right}+{position_top}')
+
+    style = ttk.Style()
+    style.theme_use("clam")
+    style.configure(".", background="#f5f5f5", font=("Arial", 10))
+    style.configure("Header.TLabel", font=("Arial", 12, "bold"))
+    style.configure("Accent.TButton", font=("Arial", 11, "bold"), foreground="white", background="#4CAF50")
+    style.map("Accent.TButton", background=[('active', '#45a049')])
+    style.configure("Treeview", font=("Arial", 9), rowheight=25)
+
+    main_frame = ttk.Frame(app, padding="20")
+    main_frame.pack(fill='both', expand=True)
+
+    header_frame = ttk.Frame(main_frame)
+    header_frame.pack(fill='x', pady=(0, 20))
 
-try:
-    logo_img = Image.open("f2f-logo.png")
-    logo_img = logo_img.resize((120, 60), Image.LANCZOS)
-    logo = ImageTk.PhotoImage(logo_img)
-    logo_label = ttk.Label(header_frame, image=logo)
-    logo_label.image = logo
-    logo_label.pack(side='left', padx=(0, 15))
-except Exception as e:
-    logging.warning(f"Logo load failed: {e}")
-    ttk.Label(header_frame, text="Fibre2Fashion", font=("Arial", 16, "bold")).pack(side='left')
-
-ttk.Label(header_frame, text="Excel/CSV to SQL Importer",
-          font=("Arial", 16), style="Header.TLabel").pack(side='left')
-
-status_frame = ttk.Frame(main_frame)
-status_frame.pack(fill='x', pady=(0, 10))
-status_label = ttk.Label(status_frame, text="Ready", font=("Arial", 10), anchor='w')
-status_label.pack(fill='x')
-
-input_frame = ttk.LabelFrame(main_frame, text="Import Settings", padding=10)
-input_frame.pack(fill='x', pady=10)
-
-file_frame = ttk.Frame(input_frame)
-file_frame.pack(fill='x', pady=5)
-ttk.Label(file_frame, text="File:").pack(side='left', padx=(0, 10))
-file_entry = ttk.Entry(file_frame, width=60)
-file_entry.pack(side='left', fill='x', expand=True, padx=(0, 10))
-ttk.Button(file_frame, text="Browse", command=browse_file).pack(side='left', padx=5)
-
-table_frame = ttk.Frame(input_frame)
-table_frame.pack(fill='x', pady=5)
-ttk.Label(table_frame, text="Table Name:").pack(side='left', padx=(0, 10))
-table_entry = ttk.Entry(table_frame, width=30)
-table_entry.pack(side='left')
-
-preview_settings_frame = ttk.Frame(input_frame)
-preview_settings_frame.pack(fill='x', pady=5)
-ttk.Label(preview_settings_frame, text="Preview Rows:").pack(side='left', padx=(0, 10))
-preview_dropdown = ttk.Combobox(preview_settings_frame, values=[10, 25, 50, 100], width=8, state='readonly')
-preview_dropdown.set(10)
-preview_dropdown.pack(side='left')
-
-button_frame = ttk.Frame(main_frame)
-button_frame.pack(fill='x', pady=10)
-import_btn = ttk.Button(button_frame, text="Import to SQL Server", command=import_data, style="Accent.TButton")
-import_btn.pack(pady=10)
-
-preview_frame = ttk.LabelFrame(main_frame, text="Data Preview", padding=10)
-preview_frame.pack(fill='both', expand=True, pady=10)
-
-update_preview(pd.DataFrame())
-
-app.mainloop()
\ No newline at end of file
+    try:
+        logo_img = Image.open("f2f-logo.png")
+        logo_img = logo_img.resize((120, 60), Image.LANCZOS)
+        logo = ImageTk.PhotoImage(logo_img)
+        logo_label = ttk.Label(header_frame, image=logo)
+        logo_label.image = logo
+        logo_label.pack(side='left', padx=(0, 15))
+    except Exception as e:
+        logging.warning(f"Logo load failed: {e}")
+        ttk.Label(header_frame, text="Fibre2Fashion", font=("Arial", 16, "bold")).pack(side='left')
+
+    ttk.Label(header_frame, text="Excel/CSV to SQL Importer",
+              font=("Arial", 16), style="Header.TLabel").pack(side='left')
+
+    status_frame = ttk.Frame(main_frame)
+    status_frame.pack(fill='x', pady=(0, 10))
+    status_label = ttk.Label(status_frame, text="Ready", font=("Arial", 10), anchor='w')
+    status_label.pack(fill='x')
+
+    input_frame = ttk.LabelFrame(main_frame, text="Import Settings", padding=10)
+    input_frame.pack(fill='x', pady=10)
+
+    file_frame = ttk.Frame(input_frame)
+    file_frame.pack(fill='x', pady=5)
+    ttk.Label(file_frame, text="File:").pack(side='left', padx=(0, 10))
+    file_entry = ttk.Entry(file_frame, width=60)
+    file_entry.pack(side='left', fill='x', expand=True, padx=(0, 10))
+    ttk.Button(file_frame, text="Browse", command=browse_file).pack(side='left', padx=5)
+
+    table_frame = ttk.Frame(input_frame)
+    table_frame.pack(fill='x', pady=5)
+    ttk.Label(table_frame, text="Table Name:").pack(side='left', padx=(0, 10))
+    table_entry = ttk.Entry(table_frame, width=30)
+    table_entry.pack(side='left')
+
+    preview_settings_frame = ttk.Frame(input_frame)
+    preview_settings_frame.pack(fill='x', pady=5)
+    ttk.Label(preview_settings_frame, text="Preview Rows:").pack(side='left', padx=(0, 10))
+    preview_dropdown = ttk.Combobox(preview_settings_frame, values=[10, 25, 50, 100], width=8, state='readonly')
+    preview_dropdown.set(10)
+    preview_dropdown.pack(side='left')
+    compact_var = tk.BooleanVar(value=False)
+    ttk.Checkbutton(preview_settings_frame, text="Memory-compact mode (large files)",
+                    variable=compact_var).pack(side='left', padx=(20, 0))
+
+    button_frame = ttk.Frame(main_frame)
+    button_frame.pack(fill='x', pady=10)
+    import_btn = ttk.Button(button_frame, text="Import to SQL Server", command=import_data, style="Accent.TButton")
+    import_btn.pack(pady=10)
+
+    preview_frame = ttk.LabelFrame(main_frame, text="Data Preview", padding=10)
+    preview_frame.pack(fill='both', expand=True, pady=10)
+
+    update_preview(pd.DataFrame())
+
+    app.mainloop()
\ No newline at end of file